@@ -1,6 +1,7 @@
 import os
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
-from typing import Any
+from typing import Any, Literal, Optional
 
 class Settings(BaseSettings):
     # API Settings
@@ -8,14 +9,36 @@ class Settings(BaseSettings):
     API_PORT: int = 8000
     
     # Database Settings
-    DB_USER: str
-    DB_PASSWORD: str
-    DB_HOST: str
-    DB_PORT: int
-    DB_NAME: str
+    DB_BACKEND: Literal["mysql", "sqlite"] = "mysql"  # "sqlite" = embedded single-node mode
+    DB_USER: Optional[str] = None
+    DB_PASSWORD: Optional[str] = None
+    DB_HOST: Optional[str] = None
+    DB_PORT: Optional[int] = None
+    DB_NAME: Optional[str] = None
+
+    # Embedded SQLite settings
+    SQLITE_PATH: str = "voting.db"
+    SQLITE_READ_POOL_SIZE: int = 4
+
+    # Idempotent vote submission
+    IDEMPOTENCY_MAX_ENTRIES: int = 10000
+    IDEMPOTENCY_TTL_SECONDS: int = 600
+
+    @model_validator(mode="after")
+    def check_mysql_settings(self) -> "Settings":
+        if self.DB_BACKEND == "mysql":
+            missing = [
+                name for name in ("DB_USER", "DB_PASSWORD", "DB_HOST", "DB_PORT", "DB_NAME")
+                if getattr(self, name) is None
+            ]
+            if missing:
+                raise ValueError(f"{', '.join(missing)} must be set when DB_BACKEND is mysql")
+        return self
     
     @property
     def DATABASE_URL(self) -> str:
+        if self.DB_BACKEND == "sqlite":
+            return f"sqlite:///{self.SQLITE_PATH}"
         return f"mysql+pymysql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
     
     class Config:
@@ -1,10 +1,11 @@
-from sqlalchemy import create_engine, exc, text
+from sqlalchemy import create_engine, event, exc, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, scoped_session
-from contextlib import contextmanager
+from sqlalchemy.orm import Session, sessionmaker
+from contextlib import contextmanager, nullcontext
 from typing import Generator
 import logging
 from app.core.config import settings
+import threading
 import time
 import pymysql
 
@@ -14,14 +15,54 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Database URL configuration
-SQLALCHEMY_DATABASE_URL = f"mysql+pymysql://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
+SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
+IS_SQLITE = settings.DB_BACKEND == "sqlite"
 
 # Connection retry settings
 MAX_RETRIES = 3
 RETRY_DELAY = 1  # seconds
 
+# SQLite pragmas applied to every connection (WAL lets readers run alongside the writer)
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",  # durable at checkpoints; safe against corruption in WAL mode
+    "foreign_keys": "ON",  # required for ON DELETE CASCADE
+    "cache_size": "-65536",  # 64 MiB page cache
+    "temp_store": "MEMORY",
+    "mmap_size": "268435456",
+}
+
+def create_sqlite_engine(read_only: bool = False):
+    """Create the embedded SQLite engine.
+
+    The writer engine holds a single connection that write_session() hands to one
+    session at a time. Readers get their own query-only pool, which may grow past
+    its size so a read never waits for a connection.
+    """
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        pool_size=settings.SQLITE_READ_POOL_SIZE if read_only else 1,
+        max_overflow=-1 if read_only else 0,
+        pool_timeout=30,
+        connect_args={"check_same_thread": False, "timeout": 30}
+    )
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+    return engine
+
 def create_db_engine():
     """Create database engine with retry mechanism"""
+    if IS_SQLITE:
+        return create_sqlite_engine()
+
     for attempt in range(MAX_RETRIES):
         try:
             engine = create_engine(
@@ -54,17 +95,40 @@ def create_db_engine():
 
 # Create engine
 engine = create_db_engine()
+# Read-only routes use a separate pool in SQLite mode; MySQL shares one engine
+read_engine = create_sqlite_engine(read_only=True) if IS_SQLITE else engine
 
-# Create session factory with thread safety
-SessionLocal = scoped_session(
-    sessionmaker(autocommit=False, autoflush=False, bind=engine)
-)
+# Session factories; every request gets its own session
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# Serializes write transactions on the single SQLite writer connection
+_write_lock = threading.Lock() if IS_SQLITE else nullcontext()
 
 # Create base class for declarative models
 Base = declarative_base()
 
+@contextmanager
+def write_session() -> Generator[Session, None, None]:
+    """Session for code that writes.
+
+    On SQLite the write lock is held until the session is closed, so a writer
+    waits on the lock (in its own thread) rather than on the connection pool.
+    """
+    with _write_lock:
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
 def get_db():
-    db = SessionLocal()
+    with write_session() as db:
+        yield db
+
+def get_read_db():
+    """Session for handlers that never write."""
+    db = ReadSessionLocal()
     try:
         yield db
     finally:
@@ -83,6 +147,8 @@ def dispose_engine():
     """Dispose of the database engine (call during application shutdown)."""
     try:
         engine.dispose()
+        if read_engine is not engine:
+            read_engine.dispose()
         logger.info("Database engine disposed successfully")
     except Exception as e:
         logger.error(f"Error disposing database engine: {str(e)}")
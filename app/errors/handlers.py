@@ -32,4 +32,12 @@ class ErrorCodes:
     TICKET_ALREADY_USED = "TICKET_ALREADY_USED"
     EVENT_NOT_FOUND = "EVENT_NOT_FOUND"
     VOTING_NOT_STARTED = "VOTING_NOT_STARTED"
-    INVALID_VOTE_COUNT = "INVALID_VOTE_COUNT" 
\ No newline at end of file
+    INVALID_VOTE_COUNT = "INVALID_VOTE_COUNT"
+    INVALID_CANDIDATE = "INVALID_CANDIDATE"
+    INVALID_TALLY_METHOD = "INVALID_TALLY_METHOD"
+    INVALID_EVENT_IDS = "INVALID_EVENT_IDS"
+    INVALID_RESOLUTION = "INVALID_RESOLUTION"
+    IDEMPOTENCY_KEY_REUSED = "IDEMPOTENCY_KEY_REUSED"
+    IDEMPOTENCY_KEY_IN_PROGRESS = "IDEMPOTENCY_KEY_IN_PROGRESS"
+    INVALID_IDEMPOTENCY_KEY = "INVALID_IDEMPOTENCY_KEY"
+    TOO_MANY_TICKETS = "TOO_MANY_TICKETS" 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Date, Integer, Boolean, JSON, ForeignKey, TIMESTAMP, DateTime
+from sqlalchemy import Column, String, Date, Integer, SmallInteger, Boolean, JSON, ForeignKey, TIMESTAMP, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.database import Base
@@ -21,6 +21,7 @@ class Event(Base):
 
     tickets = relationship("Ticket", back_populates="event", cascade="all, delete-orphan")
     votes = relationship("Vote", back_populates="event", cascade="all, delete-orphan")
+    rollups = relationship("VoteRollup", back_populates="event", cascade="all, delete-orphan")
 
 class Ticket(Base):
     __tablename__ = "tickets"
@@ -36,13 +37,30 @@ class Ticket(Base):
 
 class Vote(Base):
     __tablename__ = "votes"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        Index("ix_votes_event_option", "event_id", "option_index"),
+        # Covers the per-ballot scan in TallyService, grouped by vote_code
+        Index("ix_votes_event_ballot", "event_id", "vote_code", "position", "option_index"),
+        {'extend_existing': True}
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     event_id = Column(String(36), ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
     vote_code = Column(String(36), ForeignKey("tickets.vote_code", ondelete="CASCADE"), nullable=False)
-    candidate = Column(String(255), nullable=False)
+    option_index = Column(SmallInteger, nullable=False)  # index into Event.options
+    position = Column(Integer, nullable=False, default=0)  # order of the choice within the ballot (0 = first)
     created_at = Column(TIMESTAMP, server_default=func.now())
 
     event = relationship("Event", back_populates="votes")
-    ticket = relationship("Ticket", back_populates="votes") 
\ No newline at end of file
+    ticket = relationship("Ticket", back_populates="votes")
+
+class VoteRollup(Base):
+    __tablename__ = "vote_rollups"
+    __table_args__ = {'extend_existing': True}
+
+    event_id = Column(String(36), ForeignKey("events.id", ondelete="CASCADE"), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)  # UTC, truncated to the minute
+    ballots = Column(Integer, nullable=False, default=0)  # tickets used in this minute
+    votes = Column(Integer, nullable=False, default=0)  # vote rows cast in this minute
+
+    event = relationship("Event", back_populates="rollups")
\ No newline at end of file
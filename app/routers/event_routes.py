@@ -1,15 +1,22 @@
+from datetime import datetime
+from typing import Optional
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
 from app.schemas.vote import EventCreate
 from fastapi.responses import JSONResponse
 from app.services.event_service import EventService
 from app.services.ticket_service import TicketService
+from app.services.vote_service import VoteService
+from app.services.rollup_service import RollupService
+from app.errors.handlers import VotingError, ErrorCodes
 from app.utils.case_utils import to_camel_case
 
 router = APIRouter(prefix="/events", tags=["events"])
 event_service = EventService()
 ticket_service = TicketService()
+vote_service = VoteService()
+rollup_service = RollupService()
 
 
 @router.post("")
@@ -34,12 +41,40 @@ async def toggle_voting(event_id: str, start_voting: bool, db: Session = Depends
 
 
 @router.get("")
-async def get_events(db: Session = Depends(get_db)):
+async def get_events(db: Session = Depends(get_read_db)):
     events = event_service.get_events(db)
     camel_case_events = to_camel_case(events)
     return camel_case_events
 
 
+@router.get("/results")
+async def get_events_results(event_ids: Optional[str] = None, db: Session = Depends(get_read_db)):
+    # Comma-separated ids; all events when the parameter is omitted.
+    # Unknown ids are left out of the response.
+    id_list = None
+    if event_ids is not None:
+        id_list = [eid.strip() for eid in event_ids.split(',') if eid.strip()]
+        if not id_list:
+            raise VotingError(
+                status_code=400,
+                message="event_ids 不可為空",
+                error_code=ErrorCodes.INVALID_EVENT_IDS
+            )
+    return vote_service.get_event_results(db, id_list)
+
+
+@router.get("/{event_id}/turnout")
+async def get_turnout(
+    event_id: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    resolution: int = 1,
+    db: Session = Depends(get_read_db)
+):
+    # start/end as ISO 8601 (naive values are UTC), resolution in minutes
+    return rollup_service.get_turnout(db, event_id, start, end, resolution)
+
+
 @router.delete("/{event_id}")
 async def delete_event(event_id: str, db: Session = Depends(get_db)):
     event_service.delete_event(db, event_id)
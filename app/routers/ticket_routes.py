@@ -1,7 +1,7 @@
 import uuid
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Form
 from sqlalchemy.orm import Session
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
 from app.models.models import Ticket
 from app.services.ticket_service import TicketService
 from fastapi.responses import JSONResponse
@@ -21,10 +21,19 @@ async def generate_ticket(
         "message": "票券生成成功"
     })
 
+@router.post("/status")
+async def get_ticket_statuses(
+    vote_codes: str = Form(...),
+    db: Session = Depends(get_read_db)
+):
+    # Comma- or newline-separated codes; rows are [vote_code, event_id, used]
+    code_list = [code.strip() for code in vote_codes.replace('\n', ',').split(',') if code.strip()]
+    return ticket_service.get_ticket_statuses(db, code_list)
+
 @router.get("/{vote_code}")
 async def get_ticket(
     vote_code: str,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     ticket = db.query(Ticket).filter(Ticket.vote_code == vote_code).first()
     if ticket:
@@ -38,7 +47,7 @@ async def get_ticket(
 @router.get("/event/{event_id}")
 async def get_ticket(
     event_id: str,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     ticket = db.query(Ticket).filter(Ticket.event_id == event_id).first()
     camel_case_ticket = to_camel_case(ticket)
@@ -47,7 +56,7 @@ async def get_ticket(
 @router.get("/event/{event_id}/tickets")
 async def get_tickets_by_event_id(
     event_id: str,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     tickets = db.query(Ticket).filter(Ticket.event_id == event_id).all()
     camel_case_tickets = to_camel_case(tickets)
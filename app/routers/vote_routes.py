@@ -1,16 +1,30 @@
-from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, Form
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, Form, Header
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db, write_session
 from app.services.vote_service import VoteService
 from app.services.ticket_service import TicketService
+from app.services.tally_service import TallyService
+from app.errors.handlers import VotingError, ErrorCodes
+from app.utils.idempotency import IdempotencyCache, IdempotencyConflict, IdempotencyInProgress, MAX_KEY_LENGTH
+from app.core.config import settings
 from fastapi.responses import JSONResponse
-from typing import List
+from typing import List, Optional
 import asyncio
 
 router = APIRouter(prefix="/votes", tags=["votes"])
 active_websockets: List[WebSocket] = []
 ticket_service = TicketService()
 vote_service = VoteService()  # Create single instance at module level
+tally_service = TallyService()
+idempotency_cache = IdempotencyCache(
+    max_entries=settings.IDEMPOTENCY_MAX_ENTRIES,
+    ttl=settings.IDEMPOTENCY_TTL_SECONDS
+)
+
+def record_vote(vote_code: str, candidate_list: List[str]) -> None:
+    with write_session() as db:
+        vote_service.submit_vote(db, vote_code, candidate_list)
 
 @router.post("/generate-ticket")
 async def generate_ticket(
@@ -24,7 +38,7 @@ async def generate_ticket(
 @router.get("/info/{vote_code}")
 async def get_vote_info(
     vote_code: str,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     ticket = ticket_service.get_vote_info(db, vote_code)
     return JSONResponse({
@@ -38,22 +52,74 @@ async def get_vote_info(
 async def submit_vote(
     vote_code: str = Form(...),
     candidate_ids: str = Form(...),
-    db: Session = Depends(get_db)
+    idempotency_key: Optional[str] = Header(None),
+    db: Session = Depends(get_read_db)
 ):
     candidate_list = [cid.strip() for cid in candidate_ids.split(',')]
-    vote_service.submit_vote(db, vote_code, candidate_list)  # Use existing instance
+
+    # A retried request replays the first successful response without touching the DB;
+    # a retry arriving while the first request is still running waits for it
+    fingerprint = (vote_code, tuple(candidate_list))
+    if idempotency_key:
+        if len(idempotency_key) > MAX_KEY_LENGTH:
+            raise VotingError(
+                status_code=400,
+                message="Idempotency-Key 過長",
+                error_code=ErrorCodes.INVALID_IDEMPOTENCY_KEY,
+                details={"maxLength": MAX_KEY_LENGTH}
+            )
+        try:
+            found, response = await idempotency_cache.reserve(idempotency_key, fingerprint)
+        except IdempotencyConflict:
+            raise VotingError(
+                status_code=422,
+                message="Idempotency-Key 已用於不同的投票內容",
+                error_code=ErrorCodes.IDEMPOTENCY_KEY_REUSED
+            )
+        except IdempotencyInProgress:
+            raise VotingError(
+                status_code=409,
+                message="相同 Idempotency-Key 的投票仍在處理中",
+                error_code=ErrorCodes.IDEMPOTENCY_KEY_IN_PROGRESS
+            )
+        if found:
+            return JSONResponse(response)
+
+    # Runs in the threadpool so waiting for the writer never blocks the event loop
+    try:
+        await run_in_threadpool(record_vote, vote_code, candidate_list)
+    except BaseException:
+        if idempotency_key:
+            idempotency_cache.abandon(idempotency_key)
+        raise
+    response = {"message": "投票成功"}
+    if idempotency_key:
+        idempotency_cache.complete(idempotency_key, response)
     
     # Get updated vote counts and broadcast to websocket clients
     vote_counts = vote_service.get_vote_counts(db, vote_code)
     for ws in active_websockets:
         await ws.send_json(vote_counts)
         
-    return JSONResponse({"message": "投票成功"})
+    return JSONResponse(response)
+
+@router.get("/idempotency/stats")
+async def get_idempotency_stats():
+    return JSONResponse(idempotency_cache.stats())
+
+@router.get("/results/{event_id}")
+async def get_results(
+    event_id: str,
+    method: str = "irv",
+    db: Session = Depends(get_read_db)
+):
+    result = tally_service.tally(db, event_id, method)
+    return JSONResponse(result)
 
 @router.websocket("/ws/updates")
 async def vote_updates(
     websocket: WebSocket,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     await websocket.accept()
     active_websockets.append(websocket)
@@ -61,6 +127,8 @@ async def vote_updates(
     try:
         while True:
             vote_counts = vote_service.get_vote_counts(db, None)  # Use existing instance
+            # End the read transaction so SQLite WAL checkpoints are not held back
+            db.close()
             await websocket.send_json(vote_counts)
             await asyncio.sleep(2)
     except WebSocketDisconnect:
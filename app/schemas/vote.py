@@ -3,11 +3,14 @@ from datetime import date
 from pydantic import BaseModel, Field
 from uuid import UUID
 
+# Votes store the option index as a SMALLINT
+MAX_OPTIONS = 32767
+
 class EventBase(BaseModel):
     event_date: date
     member_count: int = Field(gt=0)
     title: str = Field(min_length=1, max_length=255)
-    options: List[str]
+    options: List[str] = Field(min_length=1, max_length=MAX_OPTIONS)
     votes_per_user: int = Field(gt=0)
     show_count: int = Field(gt=0)
 
@@ -39,7 +42,7 @@ class VoteResponse(BaseModel):
     id: UUID
     event_id: UUID
     vote_code: UUID
-    candidate: str
+    option_index: int
 
     class Config:
         from_attributes = True
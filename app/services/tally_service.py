@@ -0,0 +1,94 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, case
+from app.models.models import Vote, Event
+from app.errors.handlers import VotingError, ErrorCodes
+from app.utils.tally import (
+    Ballots, pack_ballots, unpack_ballot_codes, ballot_code_base, can_encode_ballots, TALLY_METHODS
+)
+from typing import Dict, List
+import numpy as np
+
+# Rows fetched per round trip when ballots are streamed row by row
+FETCH_CHUNK = 100_000
+
+class TallyService:
+    @staticmethod
+    def load_ballots(db: Session, event_id: str) -> Ballots:
+        event = db.query(Event).filter(Event.id == event_id).first()
+        if not event:
+            raise VotingError(
+                status_code=404,
+                message="活動不存在",
+                error_code=ErrorCodes.EVENT_NOT_FOUND
+            )
+
+        candidates = list(event.options)
+        if can_encode_ballots(len(candidates), event.votes_per_user):
+            return TallyService._load_grouped(db, event_id, candidates, event.votes_per_user)
+        return TallyService._load_rows(db, event_id, candidates)
+
+    @staticmethod
+    def _load_grouped(db: Session, event_id: str, candidates: List[str], max_choices: int) -> Ballots:
+        """Let the database collapse identical ballots.
+
+        Each ballot is encoded as one integer (see unpack_ballot_codes) while
+        scanning ix_votes_event_ballot, then grouped by that code, so only the
+        distinct ballots and their counts leave the database.
+        """
+        base = ballot_code_base(len(candidates))
+        place_value = case({p: base ** p for p in range(max_choices)}, value=Vote.position, else_=0)
+        ballots = select(
+            func.sum((Vote.option_index + 1) * place_value).label("code")
+        ).where(
+            Vote.event_id == event_id
+        ).group_by(Vote.vote_code).subquery()
+
+        rows = db.execute(
+            select(ballots.c.code, func.count().label("count")).group_by(ballots.c.code)
+        ).all()
+        if not rows:
+            return pack_ballots(np.empty(0), np.empty(0), np.empty(0), candidates)
+
+        codes, counts = zip(*rows)
+        return unpack_ballot_codes(
+            np.fromiter(map(int, codes), dtype=np.int64, count=len(codes)),
+            np.fromiter(counts, dtype=np.int64, count=len(counts)),
+            max_choices,
+            candidates
+        )
+
+    @staticmethod
+    def _load_rows(db: Session, event_id: str, candidates: List[str]) -> Ballots:
+        """Stream (vote_code, option_index, position) rows for ballots too long to encode."""
+        stmt = select(Vote.vote_code, Vote.option_index, Vote.position).where(Vote.event_id == event_id)
+
+        # vote codes are interned to integer ballot keys as they arrive
+        ballot_ids: Dict[str, int] = {}
+        keys, options, positions = [], [], []
+        for chunk in db.execute(stmt.execution_options(yield_per=FETCH_CHUNK)).partitions():
+            chunk_codes, chunk_options, chunk_positions = zip(*chunk)
+            keys.append(np.fromiter(
+                (ballot_ids.setdefault(code, len(ballot_ids)) for code in chunk_codes),
+                dtype=np.int64,
+                count=len(chunk_codes)
+            ))
+            options.append(np.fromiter(chunk_options, dtype=np.int64, count=len(chunk_options)))
+            positions.append(np.fromiter(chunk_positions, dtype=np.int64, count=len(chunk_positions)))
+
+        if not keys:
+            return pack_ballots(np.empty(0), np.empty(0), np.empty(0), candidates)
+        return pack_ballots(np.concatenate(keys), np.concatenate(options), np.concatenate(positions), candidates)
+
+    @staticmethod
+    def tally(db: Session, event_id: str, method: str) -> Dict:
+        if method not in TALLY_METHODS:
+            raise VotingError(
+                status_code=400,
+                message="不支援的計票方式",
+                error_code=ErrorCodes.INVALID_TALLY_METHOD,
+                details={"method": method, "supported": list(TALLY_METHODS)}
+            )
+
+        ballots = TallyService.load_ballots(db, event_id)
+        result = TALLY_METHODS[method](ballots)
+        return {"method": method, "ballots": ballots.ballot_count, **result}
@@ -1,8 +1,12 @@
 from sqlalchemy.orm import Session
 from app.models.models import Ticket, Event
 from app.errors.handlers import VotingError, ErrorCodes
+from typing import Any, Dict, List
 import uuid
 
+# Upper bound on vote codes per batch status request
+MAX_STATUS_BATCH = 1000
+
 class TicketService:
     @staticmethod
     def generate_ticket(db: Session, event_id: str) -> Ticket:
@@ -56,4 +60,30 @@ class TicketService:
                 message="Failed to generate tickets",
                 error_code="TICKET_GENERATION_FAILED",
                 details={"error": str(e)}
-            ) 
\ No newline at end of file
+            )
+
+    @staticmethod
+    def get_ticket_statuses(db: Session, vote_codes: List[str]) -> Dict[str, Any]:
+        """Resolve many vote codes with a single IN query.
+
+        Found tickets come back as compact [vote_code, event_id, used] rows;
+        unknown codes are listed separately.
+        """
+        codes = list(dict.fromkeys(vote_codes))
+        if len(codes) > MAX_STATUS_BATCH:
+            raise VotingError(
+                status_code=400,
+                message=f"一次最多查詢 {MAX_STATUS_BATCH} 張票券",
+                error_code=ErrorCodes.TOO_MANY_TICKETS,
+                details={"max_tickets": MAX_STATUS_BATCH, "submitted_tickets": len(codes)}
+            )
+
+        rows = db.query(Ticket.vote_code, Ticket.event_id, Ticket.used).filter(
+            Ticket.vote_code.in_(codes)
+        ).all() if codes else []
+
+        found = {row.vote_code for row in rows}
+        return {
+            "tickets": [[row.vote_code, row.event_id, 1 if row.used else 0] for row in rows],
+            "missing": [code for code in codes if code not in found]
+        }
\ No newline at end of file
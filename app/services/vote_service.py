@@ -1,8 +1,10 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, case
 from app.models.models import Vote, Ticket, Event
 from app.errors.handlers import VotingError, ErrorCodes
-from typing import Dict, List
+from app.services.rollup_service import RollupService
+from typing import Any, Dict, List, Optional
+from collections import Counter
 import uuid
 
 class VoteService:
@@ -39,15 +41,37 @@ class VoteService:
                 details={"max_votes": event.votes_per_user, "submitted_votes": len(candidate_ids)}
             )
 
+        option_indexes = {option: i for i, option in enumerate(event.options)}
+        unknown = [cid for cid in candidate_ids if cid not in option_indexes]
+        if unknown:
+            raise VotingError(
+                status_code=400,
+                message="候選項目不存在",
+                error_code=ErrorCodes.INVALID_CANDIDATE,
+                details={"invalid_candidates": unknown}
+            )
+
+        # A ballot lists each option once; repeats would be counted twice by get_vote_counts
+        repeated = [cid for cid, count in Counter(candidate_ids).items() if count > 1]
+        if repeated:
+            raise VotingError(
+                status_code=400,
+                message="候選項目重複",
+                error_code=ErrorCodes.INVALID_CANDIDATE,
+                details={"duplicate_candidates": repeated}
+            )
+
+        event_id = ticket.event_id
         try:
             ticket.used = True
             
-            for candidate_id in candidate_ids:
+            for position, candidate_id in enumerate(candidate_ids):
                 vote = Vote(
                     id=str(uuid.uuid4()),
-                    event_id=ticket.event_id,
+                    event_id=event_id,
                     vote_code=vote_code,
-                    candidate=candidate_id.strip()
+                    option_index=option_indexes[candidate_id],
+                    position=position
                 )
                 db.add(vote)
             
@@ -61,13 +85,79 @@ class VoteService:
                 details={"error": str(e)}
             )
 
+        # Outside the ballot transaction: a busy turnout bucket never fails a vote
+        RollupService.record_vote(db, event_id, len(candidate_ids))
+
     @staticmethod
     def get_vote_counts(db: Session, event_id: str) -> Dict[str, int]:
+        event = db.query(Event).filter(Event.id == event_id).first()
+        if not event:
+            return {}
+
         vote_counts = db.query(
-            Vote.candidate,
+            Vote.option_index,
             func.count(Vote.id).label('count')
         ).filter(
             Vote.event_id == event_id
-        ).group_by(Vote.candidate).all()
+        ).group_by(Vote.option_index).all()
+        
+        return {event.options[v.option_index]: v.count for v in vote_counts}
+
+    @staticmethod
+    def get_event_results(db: Session, event_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Counts, turnout and voting state for many events in a single query.
+
+        Events that do not exist are left out of the result. Without event_ids
+        every event is returned.
+        """
+        tickets = db.query(
+            Ticket.event_id,
+            func.count(Ticket.vote_code).label('total'),
+            func.sum(case((Ticket.used == True, 1), else_=0)).label('used')
+        )
+        votes = db.query(
+            Vote.event_id,
+            Vote.option_index,
+            func.count(Vote.id).label('count')
+        )
+        events = db.query(
+            Event.id,
+            Event.options,
+            Event.is_voting_started
+        )
+        # Restrict the aggregates too, so their cost follows the requested events only
+        if event_ids is not None:
+            tickets = tickets.filter(Ticket.event_id.in_(event_ids))
+            votes = votes.filter(Vote.event_id.in_(event_ids))
+            events = events.filter(Event.id.in_(event_ids))
+
+        tickets = tickets.group_by(Ticket.event_id).subquery()
+        votes = votes.group_by(Vote.event_id, Vote.option_index).subquery()
+
+        query = events.add_columns(
+            tickets.c.total,
+            tickets.c.used,
+            votes.c.option_index,
+            votes.c.count
+        ).outerjoin(
+            tickets, tickets.c.event_id == Event.id
+        ).outerjoin(
+            votes, votes.c.event_id == Event.id
+        )
+
+        # One row per (event, voted option); events without votes yield a single row
+        results: Dict[str, Dict[str, Any]] = {}
+        for row in query.all():
+            result = results.get(row.id)
+            if result is None:
+                result = results[row.id] = {
+                    "eventId": row.id,
+                    "isVotingStarted": bool(row.is_voting_started),
+                    "ticketsUsed": int(row.used or 0),
+                    "ticketsTotal": int(row.total or 0),
+                    "counts": {option: 0 for option in row.options}
+                }
+            if row.option_index is not None:
+                result["counts"][row.options[row.option_index]] = row.count
         
-        return {v.candidate: v.count for v in vote_counts} 
\ No newline at end of file
+        return list(results.values())
\ No newline at end of file
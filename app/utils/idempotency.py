@@ -0,0 +1,126 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Hashable, Tuple
+import asyncio
+import time
+
+# Longest Idempotency-Key header accepted; clients normally send a UUID
+MAX_KEY_LENGTH = 255
+
+class IdempotencyConflict(Exception):
+    """The key was already used with a different request payload."""
+
+class IdempotencyInProgress(Exception):
+    """The first request with this key is still running after the wait timeout."""
+
+class IdempotencyCache:
+    """Bounded LRU cache of successful responses keyed by client idempotency key.
+
+    Entries expire after `ttl` seconds; once `max_entries` is reached the least
+    recently used entry is evicted. Each entry remembers a fingerprint of the
+    request payload so a key reused for a different request is detected.
+
+    A key is reserved as pending before the request is processed. Retries that
+    arrive meanwhile wait for the first request and replay its response, or
+    take over the key if it failed. Reservations live on the event loop, so
+    `reserve`, `complete` and `abandon` must be called from it.
+    """
+
+    def __init__(self, max_entries: int, ttl: float, wait_timeout: float = 30):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.wait_timeout = wait_timeout
+        self._entries: "OrderedDict[str, Tuple[float, Hashable, Any]]" = OrderedDict()
+        self._pending: Dict[str, Tuple[Hashable, asyncio.Event]] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.conflicts = 0
+        self.evictions = 0
+        self.waits = 0
+        self.peak_hits_per_minute = 0
+        self._minute = 0
+        self._minute_hits = 0
+
+    async def reserve(self, key: str, fingerprint: Hashable) -> Tuple[bool, Any]:
+        """Return (found, response).
+
+        When found is False the caller owns the key and must call `complete`
+        or `abandon` once the request finishes. Raises IdempotencyConflict if
+        the key was used with a different payload, and IdempotencyInProgress
+        if the request holding the key does not finish within `wait_timeout`.
+        """
+        deadline = time.monotonic() + self.wait_timeout
+        while True:
+            now = time.monotonic()
+            with self._lock:
+                pending = self._pending.get(key)
+                if pending is not None:
+                    if pending[0] != fingerprint:
+                        self.conflicts += 1
+                        raise IdempotencyConflict(key)
+                    self.waits += 1
+                    done = pending[1]
+                else:
+                    entry = self._entries.get(key)
+                    if entry is not None and entry[0] <= now:
+                        del self._entries[key]
+                        entry = None
+
+                    if entry is None:
+                        self.misses += 1
+                        self._pending[key] = (fingerprint, asyncio.Event())
+                        return False, None
+
+                    if entry[1] != fingerprint:
+                        self.conflicts += 1
+                        raise IdempotencyConflict(key)
+
+                    self._entries.move_to_end(key)
+                    self._record_hit(now)
+                    return True, entry[2]
+
+            try:
+                await asyncio.wait_for(done.wait(), max(deadline - now, 0))
+            except asyncio.TimeoutError:
+                raise IdempotencyInProgress(key)
+
+    def complete(self, key: str, response: Any) -> None:
+        """Store the response for a reserved key and wake up waiting retries."""
+        now = time.monotonic()
+        with self._lock:
+            fingerprint, done = self._pending.pop(key)
+            self._entries[key] = (now + self.ttl, fingerprint, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        done.set()
+
+    def abandon(self, key: str) -> None:
+        """Release a reserved key after a failed request so a retry can run it."""
+        with self._lock:
+            _, done = self._pending.pop(key)
+        done.set()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "pending": len(self._pending),
+                "hits": self.hits,
+                "misses": self.misses,
+                "conflicts": self.conflicts,
+                "waits": self.waits,
+                "evictions": self.evictions,
+                "peakHitsPerMinute": max(self.peak_hits_per_minute, self._minute_hits)
+            }
+
+    def _record_hit(self, now: float) -> None:
+        self.hits += 1
+        minute = int(now // 60)
+        if minute != self._minute:
+            self.peak_hits_per_minute = max(self.peak_hits_per_minute, self._minute_hits)
+            self._minute = minute
+            self._minute_hits = 0
+        self._minute_hits += 1
@@ -0,0 +1,180 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+import numpy as np
+
+
+@dataclass
+class Ballots:
+    """An event's ballots packed into dense arrays.
+
+    choices[i, p] is the candidate index the i-th ballot put at position p,
+    padded with -1 past the end of the ballot. weights[i] is the number of
+    identical ballots row i stands for.
+    """
+    candidates: List[str]
+    choices: np.ndarray
+    weights: np.ndarray
+
+    @property
+    def ballot_count(self) -> int:
+        return int(self.weights.sum())
+
+
+def pack_ballots(
+    ballot_keys: np.ndarray,
+    candidate_idx: np.ndarray,
+    positions: np.ndarray,
+    candidates: List[str],
+    weights: Optional[np.ndarray] = None
+) -> Ballots:
+    """Pack (ballot, candidate, position) rows into a Ballots instance.
+
+    Rows may arrive in any order. Repeated choices for the same candidate on one
+    ballot are dropped, keeping the highest-ranked one. weights, if given, holds
+    one entry per distinct ballot key in ascending key order.
+    """
+    n_candidates = len(candidates)
+    if ballot_keys.size == 0:
+        return Ballots(candidates, np.empty((0, 0), dtype=np.int32), np.empty(0, dtype=np.int64))
+
+    _, ballot_idx = np.unique(ballot_keys, return_inverse=True)
+    ballot_idx = ballot_idx.astype(np.int64)
+    candidate_idx = candidate_idx.astype(np.int64)
+
+    order = np.lexsort((positions, ballot_idx))
+    ballot_idx = ballot_idx[order]
+    candidate_idx = candidate_idx[order]
+
+    # First occurrence of every (ballot, candidate) pair in ranking order
+    _, first = np.unique(ballot_idx * n_candidates + candidate_idx, return_index=True)
+    first.sort()
+    ballot_idx = ballot_idx[first]
+    candidate_idx = candidate_idx[first]
+
+    # Column of each choice = its offset from the start of its ballot
+    n_ballots = int(ballot_idx[-1]) + 1
+    starts = np.searchsorted(ballot_idx, np.arange(n_ballots))
+    columns = np.arange(ballot_idx.size) - starts[ballot_idx]
+
+    choices = np.full((n_ballots, int(columns.max()) + 1), -1, dtype=np.int32)
+    choices[ballot_idx, columns] = candidate_idx
+
+    if weights is None:
+        weights = np.ones(n_ballots, dtype=np.int64)
+    return Ballots(candidates, choices, np.asarray(weights, dtype=np.int64))
+
+
+# Ballot codes must fit a signed 64-bit SQL integer
+MAX_BALLOT_CODE = 2 ** 62
+
+
+def ballot_code_base(n_candidates: int) -> int:
+    return n_candidates + 1
+
+
+def can_encode_ballots(n_candidates: int, max_choices: int) -> bool:
+    return ballot_code_base(n_candidates) ** max_choices <= MAX_BALLOT_CODE
+
+
+def unpack_ballot_codes(
+    codes: np.ndarray,
+    counts: np.ndarray,
+    max_choices: int,
+    candidates: List[str]
+) -> Ballots:
+    """Build Ballots from distinct ballot codes and how often each was cast.
+
+    A ballot is encoded as sum((candidate + 1) * base ** position) with
+    base = len(candidates) + 1, so digit 0 means "no choice at this position".
+    """
+    codes = np.asarray(codes, dtype=np.int64)
+    base = ballot_code_base(len(candidates))
+    digits = (codes[:, None] // base ** np.arange(max_choices, dtype=np.int64)) % base - 1
+    present = digits >= 0
+    ballot_keys = np.broadcast_to(np.arange(codes.size)[:, None], digits.shape)[present]
+    positions = np.broadcast_to(np.arange(max_choices), digits.shape)[present]
+    return pack_ballots(ballot_keys, digits[present], positions, candidates, counts)
+
+
+def instant_runoff(ballots: Ballots) -> Dict:
+    """Instant-runoff voting.
+
+    Each round every ballot counts for its highest-ranked candidate still in the
+    race. A candidate with more than half of the continuing weight wins; otherwise
+    the candidate with the fewest votes is eliminated (ties go to the candidate
+    listed last in the event options) and the next round starts.
+    """
+    if ballots.ballot_count == 0:
+        return {"winner": None, "rounds": []}
+
+    candidates = ballots.candidates
+    n_candidates = len(candidates)
+    choices = ballots.choices
+    weights = ballots.weights
+    rows = np.arange(choices.shape[0])
+    present = choices >= 0
+    # Index n_candidates is a sentinel that is always "eliminated", used for padding
+    safe_choices = np.where(present, choices, n_candidates)
+
+    eliminated = np.zeros(n_candidates + 1, dtype=bool)
+    eliminated[n_candidates] = True
+    rounds = []
+    winner = None
+
+    while not eliminated[:n_candidates].all():
+        continuing = ~eliminated[safe_choices]
+        has_choice = continuing.any(axis=1)
+        top = safe_choices[rows, continuing.argmax(axis=1)][has_choice]
+        counts = np.bincount(top, weights=weights[has_choice], minlength=n_candidates)[:n_candidates]
+
+        active = ~eliminated[:n_candidates]
+        rounds.append({c: int(counts[i]) for i, c in enumerate(candidates) if active[i]})
+
+        total = counts.sum()
+        leader = int(np.argmax(np.where(active, counts, -1)))
+        if counts[leader] * 2 > total or active.sum() == 1:
+            winner = candidates[leader]
+            break
+
+        # Among the lowest, eliminate the one listed last
+        lowest = np.where(active, counts, np.inf)
+        loser = n_candidates - 1 - int(np.argmin(lowest[::-1]))
+        eliminated[loser] = True
+
+    return {"winner": winner, "rounds": rounds}
+
+
+def borda(ballots: Ballots) -> Dict:
+    """Borda count: a choice at position p scores (number of candidates - 1 - p)."""
+    n_candidates = len(ballots.candidates)
+    choices = ballots.choices
+    present = choices >= 0
+    points = np.broadcast_to(n_candidates - 1 - np.arange(choices.shape[1]), choices.shape)
+    scores = np.bincount(
+        choices[present],
+        weights=(points * ballots.weights[:, None])[present],
+        minlength=n_candidates
+    )
+    return _ranked_result(ballots.candidates, scores)
+
+
+def approval(ballots: Ballots) -> Dict:
+    """Approval voting: every candidate listed on a ballot receives its weight."""
+    n_candidates = len(ballots.candidates)
+    choices = ballots.choices
+    present = choices >= 0
+    weights = np.broadcast_to(ballots.weights[:, None], choices.shape)
+    scores = np.bincount(choices[present], weights=weights[present], minlength=n_candidates)
+    return _ranked_result(ballots.candidates, scores)
+
+
+def _ranked_result(candidates: List[str], scores: np.ndarray) -> Dict:
+    winner = candidates[int(np.argmax(scores))] if len(candidates) and scores.any() else None
+    return {"winner": winner, "scores": {c: int(scores[i]) for i, c in enumerate(candidates)}}
+
+
+TALLY_METHODS = {
+    "irv": instant_runoff,
+    "borda": borda,
+    "approval": approval,
+}
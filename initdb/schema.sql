@@ -27,12 +27,27 @@ CREATE TABLE IF NOT EXISTS votes (
   id VARCHAR(36) PRIMARY KEY,
   event_id VARCHAR(36) NOT NULL,
   vote_code VARCHAR(36) NOT NULL,
-  candidate VARCHAR(255) NOT NULL,
+  option_index SMALLINT NOT NULL,
+  position INT NOT NULL DEFAULT 0,
   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   CONSTRAINT fk_event_vote
     FOREIGN KEY(event_id)
       REFERENCES events(id) ON DELETE CASCADE,
   CONSTRAINT fk_ticket_vote
     FOREIGN KEY(vote_code)
-      REFERENCES tickets(vote_code) ON DELETE CASCADE
+      REFERENCES tickets(vote_code) ON DELETE CASCADE,
+  INDEX ix_votes_event_option (event_id, option_index),
+  INDEX ix_votes_event_ballot (event_id, vote_code, position, option_index)
+);
+
+-- 建立每分鐘投票統計資料表
+CREATE TABLE IF NOT EXISTS vote_rollups (
+  event_id VARCHAR(36) NOT NULL,
+  bucket_start DATETIME NOT NULL,
+  ballots INT NOT NULL DEFAULT 0,
+  votes INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (event_id, bucket_start),
+  CONSTRAINT fk_event_rollup
+    FOREIGN KEY(event_id)
+      REFERENCES events(id) ON DELETE CASCADE
 );
@@ -14,6 +14,11 @@ sys.path.append(current_dir)
 from app.core.config import settings
 from app.models.models import Base  # Import your SQLAlchemy models
 
+# The revisions use MySQL-only SQL. SQLite databases are created at the current
+# schema by init_db() and are never migrated.
+if settings.DB_BACKEND == "sqlite":
+    raise RuntimeError("Migrations only support MySQL; SQLite databases are created by init_db()")
+
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -0,0 +1,37 @@
+"""add votes.position for ranked ballots
+
+Revision ID: 0001_vote_position
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0001_vote_position"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("votes", sa.Column("position", sa.Integer(), nullable=False, server_default="0"))
+
+    # Ballots cast before this column existed kept no order; number their choices
+    # so every (vote_code, position) pair is unique
+    op.execute(
+        """
+        UPDATE votes v
+        JOIN (
+            SELECT id, ROW_NUMBER() OVER (PARTITION BY vote_code ORDER BY id) - 1 AS pos
+            FROM votes
+        ) numbered ON numbered.id = v.id
+        SET v.position = numbered.pos
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("votes", "position")
@@ -0,0 +1,75 @@
+"""store votes as an index into events.options
+
+Revision ID: 0002_vote_option_index
+Revises: 0001_vote_position
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0002_vote_option_index"
+down_revision = "0001_vote_position"
+branch_labels = None
+depends_on = None
+
+events = sa.table(
+    "events",
+    sa.column("id", sa.String(36)),
+    sa.column("options", sa.JSON()),
+)
+
+votes = sa.table(
+    "votes",
+    sa.column("event_id", sa.String(36)),
+    sa.column("candidate", sa.String(255)),
+    sa.column("option_index", sa.SmallInteger()),
+)
+
+
+def upgrade() -> None:
+    op.add_column("votes", sa.Column("option_index", sa.SmallInteger(), nullable=True))
+
+    conn = op.get_bind()
+    for event_id, options in conn.execute(sa.select(events.c.id, events.c.options)).all():
+        options = list(options or [])
+        candidates = conn.execute(
+            sa.select(votes.c.candidate).where(votes.c.event_id == event_id).distinct()
+        ).scalars().all()
+
+        # Keep ballots cast for names outside the options by appending them
+        extra = sorted(set(candidates) - set(options))
+        if extra:
+            options.extend(extra)
+            conn.execute(events.update().where(events.c.id == event_id).values(options=options))
+
+        for index, option in enumerate(options):
+            if option in candidates:
+                conn.execute(
+                    votes.update()
+                    .where(votes.c.event_id == event_id, votes.c.candidate == option)
+                    .values(option_index=index)
+                )
+
+    op.alter_column("votes", "option_index", existing_type=sa.SmallInteger(), nullable=False)
+    op.drop_column("votes", "candidate")
+    op.create_index("ix_votes_event_option", "votes", ["event_id", "option_index"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_votes_event_option", table_name="votes")
+    op.add_column("votes", sa.Column("candidate", sa.String(255), nullable=True))
+
+    conn = op.get_bind()
+    for event_id, options in conn.execute(sa.select(events.c.id, events.c.options)).all():
+        for index, option in enumerate(options or []):
+            conn.execute(
+                votes.update()
+                .where(votes.c.event_id == event_id, votes.c.option_index == index)
+                .values(candidate=option)
+            )
+
+    op.alter_column("votes", "candidate", existing_type=sa.String(255), nullable=False)
+    op.drop_column("votes", "option_index")
@@ -0,0 +1,46 @@
+"""per-minute turnout rollups
+
+Revision ID: 0003_vote_rollups
+Revises: 0002_vote_option_index
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0003_vote_rollups"
+down_revision = "0002_vote_option_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "vote_rollups",
+        sa.Column("event_id", sa.String(36), sa.ForeignKey("events.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(), primary_key=True),
+        sa.Column("ballots", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("votes", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # Backfill from existing ballots. Live buckets use the database clock in UTC
+    # (see RollupService), and TIMESTAMP columns are converted to the session
+    # time zone on read, so created_at is read in UTC here as well.
+    op.execute("SET time_zone = '+00:00'")
+    op.execute(
+        """
+        INSERT INTO vote_rollups (event_id, bucket_start, ballots, votes)
+        SELECT event_id,
+               DATE_FORMAT(created_at, '%Y-%m-%d %H:%i:00') AS bucket_start,
+               COUNT(DISTINCT vote_code),
+               COUNT(*)
+        FROM votes
+        GROUP BY event_id, bucket_start
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("vote_rollups")
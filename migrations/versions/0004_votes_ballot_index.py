@@ -0,0 +1,25 @@
+"""covering index for loading ballots per event
+
+Revision ID: 0004_votes_ballot_index
+Revises: 0003_vote_rollups
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0004_votes_ballot_index"
+down_revision = "0003_vote_rollups"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_votes_event_ballot", "votes", ["event_id", "vote_code", "position", "option_index"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_votes_event_ballot", table_name="votes")
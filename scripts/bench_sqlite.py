@@ -0,0 +1,124 @@
+import argparse
+import datetime
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+def request(url, data=None, json_body=None, timeout=60):
+    """Send a request and return (status, decoded JSON body)."""
+    headers = {}
+    body = None
+    if json_body is not None:
+        body = json.dumps(json_body).encode()
+        headers["Content-Type"] = "application/json"
+    elif data is not None:
+        body = urllib.parse.urlencode(data).encode()
+        headers["Content-Type"] = "application/x-www-form-urlencoded"
+    req = urllib.request.Request(url, data=body, headers=headers, method="POST" if body is not None else "GET")
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.status, json.loads(resp.read() or b"null")
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read() or b"null")
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark vote throughput over HTTP on the embedded SQLite backend')
+    parser.add_argument('--voters', '-n', type=int, default=2000, help='Number of tickets to vote with')
+    parser.add_argument('--options', '-o', type=int, default=8, help='Number of event options')
+    parser.add_argument('--votes-per-user', '-k', type=int, default=3, help='Choices per ballot')
+    parser.add_argument('--concurrency', '-c', type=int, default=200, help='Concurrent HTTP clients')
+    parser.add_argument('--path', help='SQLite file (defaults to a temporary file)')
+
+    args = parser.parse_args()
+
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    path = args.path or os.path.join(tempfile.mkdtemp(), "bench.db")
+    port = free_port()
+    base = f"http://127.0.0.1:{port}/api"
+
+    env = dict(os.environ, DB_BACKEND="sqlite", SQLITE_PATH=path)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=project_root,
+        env=env,
+        stdout=subprocess.DEVNULL
+    )
+    try:
+        # Wait for the server to come up
+        for _ in range(100):
+            try:
+                request(f"{base}/events", timeout=1)
+                break
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.1)
+
+        options = [f"option-{i}" for i in range(args.options)]
+        _, created = request(f"{base}/events", json_body={
+            "event_date": datetime.date.today().isoformat(),
+            "member_count": args.voters,
+            "title": "benchmark",
+            "options": options,
+            "votes_per_user": args.votes_per_user,
+            "show_count": 1
+        })
+        event_id, codes = created["event_id"], created["tickets"]
+        request(f"{base}/events/{event_id}/toggle-voting?start_voting=true", data={})
+
+        def vote(i):
+            choices = [options[(i + j) % len(options)] for j in range(args.votes_per_user)]
+            start = time.perf_counter()
+            status, _ = request(f"{base}/votes", data={"vote_code": codes[i], "candidate_ids": ",".join(choices)})
+            return status, time.perf_counter() - start
+
+        # Poll a read endpoint during the run to show the server keeps answering
+        done = threading.Event()
+        read_latencies = []
+
+        def poll_reads():
+            while not done.is_set():
+                start = time.perf_counter()
+                request(f"{base}/events/results?event_ids={event_id}")
+                read_latencies.append(time.perf_counter() - start)
+                time.sleep(0.05)
+
+        print(f"{path}: {args.voters} voters, {args.concurrency} concurrent clients")
+
+        poller = threading.Thread(target=poll_reads)
+        poller.start()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            results = list(pool.map(vote, range(args.voters)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        poller.join()
+
+        statuses = Counter(status for status, _ in results)
+        latencies = sorted(latency for _, latency in results)
+        print(f"submit    {elapsed:8.3f}s  {args.voters / elapsed:8.0f} ballots/s  statuses={dict(statuses)}")
+        print(f"latency   p50={latencies[len(latencies) // 2] * 1000:.0f}ms  p99={latencies[int(len(latencies) * 0.99)] * 1000:.0f}ms")
+        if read_latencies:
+            print(f"reads     {len(read_latencies)} during run, max {max(read_latencies) * 1000:.0f}ms")
+
+        _, results = request(f"{base}/events/results?event_ids={event_id}")
+        print(f"counted   {sum(results[0]['counts'].values())} votes, {results[0]['ticketsUsed']} tickets used")
+    finally:
+        server.terminate()
+        server.wait()
+
+if __name__ == "__main__":
+    main()
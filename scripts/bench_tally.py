@@ -0,0 +1,90 @@
+import argparse
+import datetime
+import os
+import sys
+import tempfile
+import time
+import uuid
+import numpy as np
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the ranked-choice tally engine')
+    parser.add_argument('--ballots', '-n', type=int, default=1_000_000, help='Number of ballots')
+    parser.add_argument('--candidates', '-c', type=int, default=8, help='Number of candidates')
+    parser.add_argument('--ranks', '-k', type=int, default=5, help='Maximum choices per ballot')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--path', help='SQLite file to load ballots from (defaults to a temporary file)')
+
+    args = parser.parse_args()
+
+    # Ballots are stored in and loaded back from an embedded SQLite database
+    path = args.path or os.path.join(tempfile.mkdtemp(), "bench_tally.db")
+    os.environ["DB_BACKEND"] = "sqlite"
+    os.environ["SQLITE_PATH"] = path
+
+    # Add project root to Python path
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.append(project_root)
+
+    from app.db.database import SessionLocal, engine, init_db
+    from app.models.models import Event
+    from app.services.tally_service import TallyService
+    from app.utils.tally import TALLY_METHODS
+
+    # Random ballots of 1..k distinct choices, emitted as flat rows like the votes table
+    rng = np.random.default_rng(args.seed)
+    lengths = rng.integers(1, args.ranks + 1, size=args.ballots)
+    preferences = np.argsort(rng.random((args.ballots, args.candidates)), axis=1)[:, :args.ranks]
+    mask = np.arange(args.ranks) < lengths[:, None]
+    ballot_keys = np.broadcast_to(np.arange(args.ballots)[:, None], mask.shape)[mask]
+    positions = np.broadcast_to(np.arange(args.ranks), mask.shape)[mask]
+    candidate_idx = preferences[mask]
+    candidates = [f"candidate-{i}" for i in range(args.candidates)]
+
+    print(f"{args.ballots} ballots, {args.candidates} candidates, {candidate_idx.size} rows")
+
+    init_db()
+    event_id = str(uuid.uuid4())
+    codes = [str(uuid.uuid4()) for _ in range(args.ballots)]
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        conn.execute(Event.__table__.insert(), [{
+            "id": event_id,
+            "event_date": datetime.date.today(),
+            "member_count": args.ballots,
+            "title": "benchmark",
+            "options": candidates,
+            "votes_per_user": args.ranks,
+            "show_count": 1
+        }])
+        # Driver-level executemany keeps seeding millions of rows tolerable
+        conn.exec_driver_sql(
+            "INSERT INTO tickets (vote_code, event_id, used) VALUES (?, ?, 1)",
+            [(code, event_id) for code in codes]
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO votes (id, event_id, vote_code, option_index, position) VALUES (?, ?, ?, ?, ?)",
+            [
+                (str(uuid.uuid4()), event_id, codes[b], int(c), int(p))
+                for b, c, p in zip(ballot_keys.tolist(), candidate_idx.tolist(), positions.tolist())
+            ]
+        )
+    print(f"insert    {time.perf_counter() - start:8.3f}s  ({path})")
+
+    with SessionLocal() as db:
+        start = time.perf_counter()
+        ballots = TallyService.load_ballots(db, event_id)
+        print(f"load      {time.perf_counter() - start:8.3f}s  {ballots.ballot_count} ballots")
+
+        # Path taken when ballots are too long to encode as one integer
+        start = time.perf_counter()
+        TallyService._load_rows(db, event_id, candidates)
+        print(f"load rows {time.perf_counter() - start:8.3f}s")
+
+    for method, tally in TALLY_METHODS.items():
+        start = time.perf_counter()
+        result = tally(ballots)
+        print(f"{method:<9} {time.perf_counter() - start:8.3f}s  winner={result['winner']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import datetime
+import os
+import tempfile
+
+# The engine is created when app.db.database is imported, so point it at a
+# throwaway SQLite file before any test module imports the app
+os.environ["DB_BACKEND"] = "sqlite"
+os.environ["SQLITE_PATH"] = os.path.join(tempfile.mkdtemp(), "test.db")
+
+import pytest
+
+from app.db.database import Base, SessionLocal, engine
+from app.models.models import Event, Ticket
+
+
+@pytest.fixture
+def db():
+    """Session on a freshly created schema, dropped again after the test."""
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def make_event(db):
+    """Create an event with `tickets` unused tickets; returns (event, vote_codes)."""
+    def make(options=("A", "B", "C"), tickets=0, votes_per_user=3, started=True):
+        event = Event(
+            event_date=datetime.date.today(),
+            member_count=tickets,
+            title="test",
+            options=list(options),
+            votes_per_user=votes_per_user,
+            show_count=1,
+            is_voting_started=started
+        )
+        db.add(event)
+        db.flush()
+        codes = [f"{event.id[:8]}-{i}" for i in range(tickets)]
+        db.add_all(Ticket(vote_code=code, event_id=event.id) for code in codes)
+        db.commit()
+        return event, codes
+    return make
@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+
+from app.utils import idempotency
+from app.utils.idempotency import IdempotencyCache, IdempotencyConflict, IdempotencyInProgress
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(idempotency, "time", clock)
+    return clock
+
+
+def stored(cache, key, fingerprint, response):
+    """Reserve and complete a key in one go."""
+    assert asyncio.run(cache.reserve(key, fingerprint)) == (False, None)
+    cache.complete(key, response)
+
+
+def test_completed_response_is_replayed():
+    cache = IdempotencyCache(max_entries=10, ttl=60)
+    stored(cache, "k", "payload", {"message": "ok"})
+
+    assert asyncio.run(cache.reserve("k", "payload")) == (True, {"message": "ok"})
+    stats = cache.stats()
+    assert (stats["entries"], stats["pending"], stats["hits"], stats["misses"]) == (1, 0, 1, 1)
+
+
+def test_reused_key_with_other_payload_conflicts():
+    cache = IdempotencyCache(max_entries=10, ttl=60)
+    stored(cache, "k", "payload", {"message": "ok"})
+
+    with pytest.raises(IdempotencyConflict):
+        asyncio.run(cache.reserve("k", "other"))
+    assert cache.stats()["conflicts"] == 1
+
+
+def test_waiter_replays_response_of_pending_request():
+    async def scenario():
+        cache = IdempotencyCache(max_entries=10, ttl=60)
+        assert await cache.reserve("k", "payload") == (False, None)
+        waiters = [asyncio.create_task(cache.reserve("k", "payload")) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert cache.stats()["pending"] == 1
+
+        cache.complete("k", {"message": "ok"})
+        return cache, await asyncio.gather(*waiters)
+
+    cache, results = asyncio.run(scenario())
+    assert results == [(True, {"message": "ok"})] * 3
+    stats = cache.stats()
+    assert (stats["pending"], stats["waits"], stats["hits"]) == (0, 3, 3)
+
+
+def test_pending_key_with_other_payload_conflicts():
+    async def scenario():
+        cache = IdempotencyCache(max_entries=10, ttl=60)
+        await cache.reserve("k", "payload")
+        with pytest.raises(IdempotencyConflict):
+            await cache.reserve("k", "other")
+
+    asyncio.run(scenario())
+
+
+def test_abandon_hands_key_to_one_waiter():
+    async def scenario():
+        cache = IdempotencyCache(max_entries=10, ttl=60)
+        await cache.reserve("k", "payload")
+        first = asyncio.create_task(cache.reserve("k", "payload"))
+        second = asyncio.create_task(cache.reserve("k", "payload"))
+        await asyncio.sleep(0)
+
+        cache.abandon("k")
+        # The first waiter to wake up takes over the key, the other keeps waiting on it
+        assert await first == (False, None)
+        await asyncio.sleep(0)
+        assert not second.done()
+
+        cache.complete("k", {"message": "ok"})
+        assert await second == (True, {"message": "ok"})
+        return cache
+
+    cache = asyncio.run(scenario())
+    assert cache.stats()["pending"] == 0
+
+
+def test_abandon_without_waiters_frees_key():
+    cache = IdempotencyCache(max_entries=10, ttl=60)
+    asyncio.run(cache.reserve("k", "payload"))
+    cache.abandon("k")
+
+    assert cache.stats()["pending"] == 0
+    assert asyncio.run(cache.reserve("k", "other")) == (False, None)
+
+
+def test_wait_timeout_raises_in_progress():
+    async def scenario():
+        cache = IdempotencyCache(max_entries=10, ttl=60, wait_timeout=0.01)
+        await cache.reserve("k", "payload")
+        with pytest.raises(IdempotencyInProgress):
+            await cache.reserve("k", "payload")
+        # The original request still owns the key and can complete it
+        cache.complete("k", {"message": "ok"})
+        assert await cache.reserve("k", "payload") == (True, {"message": "ok"})
+
+    asyncio.run(scenario())
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = IdempotencyCache(max_entries=10, ttl=60)
+    stored(cache, "k", "payload", {"message": "ok"})
+
+    clock.now = 59.9
+    assert asyncio.run(cache.reserve("k", "payload")) == (True, {"message": "ok"})
+    clock.now = 60
+    # Expired: the key is free again, even for a different payload
+    assert asyncio.run(cache.reserve("k", "other")) == (False, None)
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = IdempotencyCache(max_entries=2, ttl=60)
+    stored(cache, "a", "a", "A")
+    stored(cache, "b", "b", "B")
+    # A hit refreshes "a", so "b" is the one evicted
+    asyncio.run(cache.reserve("a", "a"))
+    stored(cache, "c", "c", "C")
+
+    assert cache.stats()["evictions"] == 1
+    assert asyncio.run(cache.reserve("a", "a")) == (True, "A")
+    assert asyncio.run(cache.reserve("c", "c")) == (True, "C")
+    assert asyncio.run(cache.reserve("b", "b")) == (False, None)
+
+
+def test_peak_hits_per_minute(clock):
+    cache = IdempotencyCache(max_entries=10, ttl=3600)
+    stored(cache, "k", "payload", "ok")
+
+    for now in (1, 2, 3, 61, 62, 125):
+        clock.now = now
+        asyncio.run(cache.reserve("k", "payload"))
+
+    stats = cache.stats()
+    assert stats["hits"] == 6
+    assert stats["peakHitsPerMinute"] == 3
@@ -0,0 +1,103 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event as sa_event
+
+from app.db.database import engine
+from app.services.vote_service import VoteService
+from main import app
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def statements():
+    """SQL statements executed on the writer engine while the test runs."""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    sa_event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    sa_event.remove(engine, "before_cursor_execute", record)
+
+
+def test_event_without_tickets_or_votes_has_zeroed_counts(db, make_event):
+    event, _ = make_event(options=["A", "B"], started=False)
+
+    assert VoteService.get_event_results(db, [event.id]) == [{
+        "eventId": event.id,
+        "isVotingStarted": False,
+        "ticketsUsed": 0,
+        "ticketsTotal": 0,
+        "counts": {"A": 0, "B": 0}
+    }]
+
+
+def test_counts_and_turnout(db, make_event):
+    event, codes = make_event(tickets=4)
+    VoteService.submit_vote(db, codes[0], ["A", "B"])
+    VoteService.submit_vote(db, codes[1], ["B"])
+
+    assert VoteService.get_event_results(db, [event.id]) == [{
+        "eventId": event.id,
+        "isVotingStarted": True,
+        "ticketsUsed": 2,
+        "ticketsTotal": 4,
+        "counts": {"A": 1, "B": 2, "C": 0}
+    }]
+
+
+def test_unknown_ids_are_left_out(db, make_event):
+    event, _ = make_event()
+
+    results = VoteService.get_event_results(db, ["no-such-event", event.id])
+    assert [result["eventId"] for result in results] == [event.id]
+    assert VoteService.get_event_results(db, ["no-such-event"]) == []
+
+
+def test_only_requested_events_are_aggregated(db, make_event, statements):
+    requested, requested_codes = make_event(tickets=2)
+    _, other_codes = make_event(tickets=3)
+    VoteService.submit_vote(db, requested_codes[0], ["A"])
+    for code in other_codes:
+        VoteService.submit_vote(db, code, ["A", "C"])
+    requested_id = requested.id
+    statements.clear()
+
+    results = VoteService.get_event_results(db, [requested_id])
+
+    assert [(r["eventId"], r["ticketsUsed"], r["ticketsTotal"], r["counts"]) for r in results] == [
+        (requested_id, 1, 2, {"A": 1, "B": 0, "C": 0})
+    ]
+    # Tickets, votes and events are each filtered by the id list, not just the outer join
+    assert len(statements) == 1
+    assert statements[0].count(" IN (") == 3
+
+
+def test_all_events_without_ids(db, make_event):
+    first, _ = make_event()
+    second, _ = make_event()
+
+    results = VoteService.get_event_results(db)
+    assert sorted(result["eventId"] for result in results) == sorted([first.id, second.id])
+
+
+def test_results_route_splits_ids(db, make_event, client):
+    first, _ = make_event()
+    second, _ = make_event()
+
+    response = client.get("/api/events/results", params={"event_ids": f"{first.id}, {second.id},unknown"})
+    assert response.status_code == 200
+    assert sorted(result["eventId"] for result in response.json()) == sorted([first.id, second.id])
+
+
+@pytest.mark.parametrize("event_ids", ["", " , "])
+def test_results_route_rejects_empty_ids(db, client, event_ids):
+    response = client.get("/api/events/results", params={"event_ids": event_ids})
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "INVALID_EVENT_IDS"
@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.errors.handlers import VotingError
+from app.models.models import VoteRollup
+from app.services.rollup_service import RollupService
+from main import app
+
+TAIPEI = timezone(timedelta(hours=8))
+
+
+@pytest.fixture
+def event_with_rollups(db, make_event):
+    event, _ = make_event()
+    for bucket, ballots in [("2026-10-18T22:59", 1), ("2026-10-18T23:49", 2), ("2026-10-19T00:01", 4)]:
+        db.add(VoteRollup(
+            event_id=event.id,
+            bucket_start=datetime.fromisoformat(bucket),
+            ballots=ballots,
+            votes=ballots * 2
+        ))
+    db.commit()
+    return event
+
+
+def test_turnout_converts_aware_bounds_to_utc(db, event_with_rollups):
+    # 07:00+08:00 is 23:00Z on the previous day
+    series = RollupService.get_turnout(
+        db,
+        event_with_rollups.id,
+        start=datetime(2026, 10, 19, 7, 0, tzinfo=TAIPEI),
+        end=datetime(2026, 10, 19, 0, 0, tzinfo=timezone.utc)
+    )
+    assert series == [
+        {"bucketStart": "2026-10-18T23:49:00", "ballots": 2, "votes": 4, "cumulativeBallots": 3}
+    ]
+
+
+def test_turnout_naive_bounds_are_utc(db, event_with_rollups):
+    series = RollupService.get_turnout(db, event_with_rollups.id, start=datetime(2026, 10, 18, 23, 0))
+    assert [bucket["bucketStart"] for bucket in series] == ["2026-10-18T23:49:00", "2026-10-19T00:01:00"]
+
+
+def test_turnout_merges_windows_aligned_to_epoch(db, event_with_rollups):
+    series = RollupService.get_turnout(db, event_with_rollups.id, resolution=60)
+    assert series == [
+        {"bucketStart": "2026-10-18T22:00:00", "ballots": 1, "votes": 2, "cumulativeBallots": 1},
+        {"bucketStart": "2026-10-18T23:00:00", "ballots": 2, "votes": 4, "cumulativeBallots": 3},
+        {"bucketStart": "2026-10-19T00:00:00", "ballots": 4, "votes": 8, "cumulativeBallots": 7},
+    ]
+
+
+def test_turnout_rejects_zero_resolution(db, event_with_rollups):
+    with pytest.raises(VotingError) as e:
+        RollupService.get_turnout(db, event_with_rollups.id, resolution=0)
+    assert e.value.error_code == "INVALID_RESOLUTION"
+
+
+def test_turnout_route_accepts_offsets(db, event_with_rollups):
+    with TestClient(app) as client:
+        response = client.get(
+            f"/api/events/{event_with_rollups.id}/turnout",
+            params={"start": "2026-10-19T07:00:00+08:00", "end": "2026-10-19T00:00:00Z"}
+        )
+    assert response.status_code == 200
+    assert [bucket["bucketStart"] for bucket in response.json()] == ["2026-10-18T23:49:00"]
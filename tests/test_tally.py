@@ -0,0 +1,135 @@
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from app.utils.tally import (
+    approval, ballot_code_base, borda, can_encode_ballots, instant_runoff, pack_ballots, unpack_ballot_codes
+)
+
+
+def pack(ballots, candidates, shuffle=True):
+    """Pack lists of candidate names into Ballots via flat (ballot, candidate, position) rows."""
+    rows = [
+        (b, candidates.index(name), p)
+        for b, ballot in enumerate(ballots)
+        for p, name in enumerate(ballot)
+    ]
+    if shuffle:
+        random.Random(0).shuffle(rows)
+    keys, idx, positions = (np.array(col) for col in zip(*rows))
+    return pack_ballots(keys, idx, positions, candidates)
+
+
+def encode(ballot, candidates):
+    base = ballot_code_base(len(candidates))
+    return sum((candidates.index(name) + 1) * base ** p for p, name in enumerate(ballot))
+
+
+def reference_irv(ballots, candidates):
+    """Plain-Python IRV with the same rules as instant_runoff."""
+    ballots = [list(dict.fromkeys(b)) for b in ballots]
+    active = list(candidates)
+    rounds = []
+    while active:
+        counts = Counter({c: 0 for c in active})
+        for ballot in ballots:
+            for name in ballot:
+                if name in counts:
+                    counts[name] += 1
+                    break
+        rounds.append(dict(counts))
+        leader = max(active, key=lambda c: (counts[c], -candidates.index(c)))
+        if counts[leader] * 2 > sum(counts.values()) or len(active) == 1:
+            return {"winner": leader, "rounds": rounds}
+        loser = min(active, key=lambda c: (counts[c], -candidates.index(c)))
+        active.remove(loser)
+    return {"winner": None, "rounds": rounds}
+
+
+def random_election(rng):
+    candidates = [f"c{i}" for i in range(rng.randint(1, 6))]
+    ballots = []
+    for _ in range(rng.randint(1, 40)):
+        length = rng.randint(1, len(candidates) + 1)
+        # Repeats allowed on purpose: the packer must drop them
+        ballots.append([rng.choice(candidates) for _ in range(length)])
+    return ballots, candidates
+
+
+def test_instant_runoff_matches_reference():
+    rng = random.Random(42)
+    for _ in range(500):
+        ballots, candidates = random_election(rng)
+        assert instant_runoff(pack(ballots, candidates)) == reference_irv(ballots, candidates)
+
+
+def test_instant_runoff_classic_example():
+    candidates = ["A", "B", "C"]
+    ballots = [["A", "B", "C"]] * 4 + [["B", "C", "A"]] * 3 + [["C", "B", "A"]] * 2
+    result = instant_runoff(pack(ballots, candidates))
+    assert result == {
+        "winner": "B",
+        "rounds": [{"A": 4, "B": 3, "C": 2}, {"A": 4, "B": 5}],
+    }
+
+
+def test_instant_runoff_eliminates_last_listed_on_tie():
+    candidates = ["A", "B", "C"]
+    ballots = [["A"], ["B"], ["C"], ["A", "C"]]
+    result = instant_runoff(pack(ballots, candidates))
+    # B and C tie for last; C is listed later and goes first, its ballot exhausts
+    assert result["rounds"][1] == {"A": 2, "B": 1}
+    assert result["winner"] == "A"
+
+
+def test_instant_runoff_no_ballots():
+    empty = pack_ballots(np.empty(0), np.empty(0), np.empty(0), ["A", "B"])
+    assert instant_runoff(empty) == {"winner": None, "rounds": []}
+
+
+def test_pack_pads_short_ballots_and_drops_repeats():
+    candidates = ["A", "B", "C"]
+    ballots = pack([["B", "A", "B"], ["C"], ["A", "A", "C"]], candidates, shuffle=False)
+    assert ballots.choices.tolist() == [[1, 0], [2, -1], [0, 2]]
+    assert ballots.weights.tolist() == [1, 1, 1]
+
+
+def test_pack_orders_choices_by_position():
+    keys = np.array(["x", "x", "x", "y"])
+    idx = np.array([2, 0, 1, 1])
+    positions = np.array([2, 0, 1, 0])
+    ballots = pack_ballots(keys, idx, positions, ["A", "B", "C"])
+    assert ballots.choices.tolist() == [[0, 1, 2], [1, -1, -1]]
+
+
+def test_borda_and_approval():
+    candidates = ["A", "B", "C"]
+    ballots = pack([["A", "B"], ["B", "C", "A"], ["B"]], candidates)
+    assert borda(ballots) == {"winner": "B", "scores": {"A": 2, "B": 5, "C": 1}}
+    assert approval(ballots) == {"winner": "B", "scores": {"A": 2, "B": 3, "C": 1}}
+
+
+def test_unpack_ballot_codes_matches_rows():
+    rng = random.Random(7)
+    for _ in range(100):
+        ballots, candidates = random_election(rng)
+        max_choices = max(len(b) for b in ballots)
+        grouped = Counter(encode(b, candidates) for b in ballots)
+        codes, counts = zip(*sorted(grouped.items()))
+        weighted = unpack_ballot_codes(np.array(codes), np.array(counts), max_choices, candidates)
+
+        expected = pack(ballots, candidates)
+        assert weighted.ballot_count == expected.ballot_count
+        for method in (instant_runoff, borda, approval):
+            assert method(weighted) == method(expected)
+
+
+@pytest.mark.parametrize("n_candidates,max_choices,expected", [
+    (8, 5, True),
+    (20, 14, True),
+    (20, 15, False),
+])
+def test_can_encode_ballots(n_candidates, max_choices, expected):
+    assert can_encode_ballots(n_candidates, max_choices) is expected
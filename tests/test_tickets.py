@@ -0,0 +1,51 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.errors.handlers import VotingError
+from app.services.ticket_service import MAX_STATUS_BATCH, TicketService
+from app.services.vote_service import VoteService
+from main import app
+
+
+def test_statuses_report_used_and_missing_codes(db, make_event):
+    event, codes = make_event(tickets=2)
+    VoteService.submit_vote(db, codes[1], ["A"])
+
+    statuses = TicketService.get_ticket_statuses(db, [codes[0], "unknown", codes[1]])
+    assert sorted(statuses["tickets"]) == sorted([[codes[0], event.id, 0], [codes[1], event.id, 1]])
+    assert statuses["missing"] == ["unknown"]
+
+
+def test_duplicate_codes_are_reported_once(db, make_event):
+    _, codes = make_event(tickets=1)
+
+    statuses = TicketService.get_ticket_statuses(db, [codes[0], "unknown", codes[0], "unknown"])
+    assert [row[0] for row in statuses["tickets"]] == [codes[0]]
+    assert statuses["missing"] == ["unknown"]
+
+
+def test_empty_batch(db):
+    assert TicketService.get_ticket_statuses(db, []) == {"tickets": [], "missing": []}
+
+
+def test_batch_limit_counts_distinct_codes(db):
+    codes = [f"code-{i}" for i in range(MAX_STATUS_BATCH)]
+    # Repeats do not count towards the limit
+    statuses = TicketService.get_ticket_statuses(db, codes + codes[:10])
+    assert len(statuses["missing"]) == MAX_STATUS_BATCH
+
+    with pytest.raises(VotingError) as e:
+        TicketService.get_ticket_statuses(db, codes + ["one-more"])
+    assert e.value.error_code == "TOO_MANY_TICKETS"
+    assert e.value.details == {"max_tickets": MAX_STATUS_BATCH, "submitted_tickets": MAX_STATUS_BATCH + 1}
+
+
+def test_status_route_accepts_commas_and_newlines(db, make_event):
+    _, codes = make_event(tickets=2)
+
+    with TestClient(app) as client:
+        response = client.post("/api/tickets/status", data={"vote_codes": f"{codes[0]}\n{codes[1]}, unknown,\n"})
+    assert response.status_code == 200
+    body = response.json()
+    assert sorted(row[0] for row in body["tickets"]) == sorted(codes)
+    assert body["missing"] == ["unknown"]
@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy import text
+
+from app.errors.handlers import VotingError
+from app.models.models import Ticket, Vote, VoteRollup
+from app.services import rollup_service
+from app.services.vote_service import VoteService
+
+
+def test_submit_vote_records_ballot_and_rollup(db, make_event):
+    event, codes = make_event(tickets=1)
+    VoteService.submit_vote(db, codes[0], ["B", "A"])
+
+    votes = db.query(Vote.option_index, Vote.position).order_by(Vote.position).all()
+    assert [tuple(v) for v in votes] == [(1, 0), (0, 1)]
+    rollup = db.query(VoteRollup).one()
+    assert (rollup.event_id, rollup.ballots, rollup.votes) == (event.id, 1, 2)
+
+
+def test_failed_rollup_does_not_fail_the_vote(db, make_event, monkeypatch):
+    _, codes = make_event(tickets=1)
+    monkeypatch.setattr(rollup_service, "_upsert", lambda db: text("UPDATE no_such_table SET x = 1"))
+
+    VoteService.submit_vote(db, codes[0], ["A"])
+
+    assert db.query(Ticket.used).filter(Ticket.vote_code == codes[0]).scalar()
+    assert db.query(Vote).count() == 1
+    assert db.query(VoteRollup).count() == 0
+
+
+def test_repeated_candidates_are_rejected(db, make_event):
+    _, codes = make_event(tickets=1)
+    with pytest.raises(VotingError) as e:
+        VoteService.submit_vote(db, codes[0], ["C", "A", "C"])
+
+    assert e.value.error_code == "INVALID_CANDIDATE"
+    assert e.value.details == {"duplicate_candidates": ["C"]}
+    assert not db.query(Ticket.used).filter(Ticket.vote_code == codes[0]).scalar()
+    assert db.query(Vote).count() == 0
+
+
+def test_unknown_candidates_are_rejected(db, make_event):
+    _, codes = make_event(tickets=1)
+    with pytest.raises(VotingError) as e:
+        VoteService.submit_vote(db, codes[0], ["A", "Z"])
+
+    assert e.value.error_code == "INVALID_CANDIDATE"
+    assert e.value.details == {"invalid_candidates": ["Z"]}